@@ -6,30 +6,192 @@ Respectfully downloads papers from economics conference pages
 
 import os
 import re
+import csv
+import codecs
+import atexit
+import hashlib
 import json
 import time
+import asyncio
 import logging
+import threading
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import IO, Any, AnyStr, Awaitable, ClassVar, Iterable, Iterator, List, Dict, Optional, Tuple
+from itertools import islice
 from urllib.parse import urljoin, urlparse
 
+import aiofiles
+import aiohttp
+import orjson
 import requests
-import pandas as pd
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.dammit import EncodingDetector
+from lxml import etree
+from urllib3.util.retry import Retry
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from tqdm import tqdm
+from tqdm.asyncio import tqdm_asyncio
 from urllib.robotparser import RobotFileParser
 
 
+# Patterns used while parsing conference pages
+_SESSION_CLS_RE = re.compile(r'session|paper|presentation')
+_PAPERS_JSON_RE = re.compile(r'Papers\s*=\s*JSON\.parse\(\'(.*?)\'\)')
+_ID_RE = re.compile(r'"id":"([a-zA-Z0-9]+)"')
+_PDF_LINK_TEXT_RE = re.compile(r'PDF|Download', re.I)
+
+# Which extraction method wins when several find the same URL (lower wins)
+_LINK_TYPE_PRIORITY = {
+    'direct_link': 0,
+    'javascript_json': 1,
+    'javascript_id': 1,
+    'session_extraction': 2,
+}
+
+# Patterns used to turn paper titles into filenames
+_FILENAME_STRIP_RE = re.compile(r'[^\w\s-]')
+_FILENAME_WS_RE = re.compile(r'[-\s]+')
+
+# ASCII characters _FILENAME_STRIP_RE removes, for bytes.translate
+_FILENAME_BAD_BYTES = bytes(c for c in range(128)
+                            if not (chr(c).isalnum() or chr(c).isspace() or chr(c) in '-_'))
+
+
+def _codec_name(encoding: str) -> Optional[str]:
+    """Python's canonical name for an encoding, or None if it is unknown"""
+    try:
+        return codecs.lookup(encoding).name
+    except LookupError:
+        return None
+
+
+def _sniff_encoding(data: bytes) -> str:
+    """Guess the encoding of an HTML document from its first bytes"""
+    # libxml2 falls back to Latin-1 when nothing is declared, which garbles
+    # UTF-8 pages, so check for a BOM or <meta> declaration and default to UTF-8
+    _, bom_encoding = EncodingDetector.strip_byte_order_mark(data)
+    if bom_encoding:
+        return bom_encoding
+
+    declared = EncodingDetector.find_declared_encoding(data, is_html=True)
+    codec = declared and _codec_name(declared)
+    # A UTF-16/32 declaration we could read as ASCII without a BOM is wrong,
+    # which is also how bs4's EncodingDetector treats it
+    if codec and not codec.startswith(('utf-16', 'utf-32')):
+        return declared
+    return 'utf-8'
+
+
+def _make_pull_parser(encoding: Optional[str]) -> etree.HTMLPullParser:
+    """HTMLPullParser for start/end events, falling back to UTF-8 for encodings libxml2 doesn't know"""
+    if encoding is None:
+        return etree.HTMLPullParser(events=('start', 'end'))
+    # libxml2 and Python accept different aliases (e.g. only Python knows 'latin_1')
+    for candidate in (encoding, _codec_name(encoding), 'utf-8'):
+        if candidate:
+            try:
+                return etree.HTMLPullParser(events=('start', 'end'), encoding=candidate)
+            except LookupError:
+                pass
+
+
+def _iter_html_events(chunks: Iterable[AnyStr],
+                      encoding: Optional[str] = None) -> Iterator[Tuple[str, etree._Element]]:
+    """Yield (event, element) start/end events while feeding HTML chunks to lxml"""
+    def make_parser(head: AnyStr) -> etree.HTMLPullParser:
+        nonlocal encoding
+        if isinstance(head, bytes):
+            # Ignore a declared charset that isn't a real encoding
+            if encoding is not None and _codec_name(encoding) is None:
+                encoding = None
+            if encoding is None:
+                encoding = _sniff_encoding(head)
+        return _make_pull_parser(encoding)
+
+    parser = None
+
+    # libxml2's push parser can lose track of the document when a chunk ends
+    # inside a tag (notably '</script>'), so only feed up to the last '>'
+    pending = None
+    for chunk in chunks:
+        data = chunk if pending is None else pending + chunk
+        if parser is None:
+            # Wait for enough of the document to find a <meta> charset
+            if len(data) < 1024:
+                pending = data
+                continue
+            parser = make_parser(data)
+
+        cut = data.rfind('>' if isinstance(data, str) else b'>') + 1
+        pending = data[cut:]
+        if cut:
+            parser.feed(data[:cut])
+            yield from parser.read_events()
+
+    if not pending and parser is None:
+        return  # Empty document
+    if pending:
+        if parser is None:
+            parser = make_parser(pending)
+        parser.feed(pending)
+
+    # Closing flushes end events for elements left open at the end of the document
+    try:
+        parser.close()
+    except etree.XMLSyntaxError:
+        pass  # Empty document
+    yield from parser.read_events()
+
+
+def _element_text(element: etree._Element) -> str:
+    """Element text with each piece stripped, like BeautifulSoup's get_text(strip=True)"""
+    return ''.join(text.strip() for text in element.itertext())
+
+
+def _title_to_filename(title: str) -> str:
+    """Clean a paper title for use as a filename (without extension)"""
+    if title.isascii():
+        filename = title.encode('ascii').translate(None, _FILENAME_BAD_BYTES).decode('ascii')
+    else:
+        # \w also keeps non-ASCII letters, which the ASCII table can't cover
+        filename = _FILENAME_STRIP_RE.sub('', title)
+    return _FILENAME_WS_RE.sub('_', filename)[:100]  # Limit length
+
+
+def _url_digest(url: str) -> str:
+    """Short hex digest of a URL, stable across runs (unlike hash())"""
+    return hashlib.blake2b(url.encode('utf-8'), digest_size=8).hexdigest()
+
+
+def _is_session_block(element: etree._Element) -> bool:
+    """Check if an element is a div/section that groups sessions, papers or presentations"""
+    return element.tag in ('div', 'section') and bool(_SESSION_CLS_RE.search(element.get('class', '')))
+
+
 class ConferenceScraper:
     """Scraper for economics conference papers with respect for robots.txt"""
 
+    ROBOTS_USER_AGENT = 'Conference-Scraper/1.0'
+
+    # Fields recorded for each download attempt
+    RESULT_COLUMNS = ['url', 'pdf_url', 'title', 'filename', 'status', 'error', 'timestamp']
+
+    # robots.txt parsers are shared across instances, keyed by netloc
+    _ROBOTS_TTL = 6 * 3600
+    # Failed fetches are retried soon, since None means robots.txt isn't enforced
+    _ROBOTS_FAILURE_TTL = 60
+    _robots_cache: ClassVar[Dict[str, Tuple[Optional[RobotFileParser], float]]] = {}
+    _robots_lock: ClassVar[threading.Lock] = threading.Lock()
+    _robots_host_locks: ClassVar[Dict[str, threading.Lock]] = {}
+
     def __init__(self, conference_url: str, download_dir: str = "downloads",
-                 log_dir: str = "logs", delay: float = 2.0):
+                 log_dir: str = "logs", delay: float = 2.0,
+                 max_concurrent: int = 10):
         """
         Initialize the Conference Scraper
 
@@ -37,12 +199,14 @@ class ConferenceScraper:
             conference_url: URL of the conference page
             download_dir: Directory to save PDFs
             log_dir: Directory for log files
-            delay: Delay between requests in seconds
+            delay: Delay between requests to the same host in seconds
+            max_concurrent: Maximum number of PDFs downloaded at once
         """
         self.conference_url = conference_url
         self.download_dir = Path(download_dir)
         self.log_dir = Path(log_dir)
         self.delay = delay
+        self.max_concurrent = max_concurrent
 
         # Create directories if they don't exist
         self.download_dir.mkdir(parents=True, exist_ok=True)
@@ -57,24 +221,105 @@ class ConferenceScraper:
             'User-Agent': 'Conference-Scraper/1.0 (Educational/Research Purpose)'
         })
 
+        # Reuse pooled keep-alive connections and retry transient server errors
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=64,
+            max_retries=Retry(total=3, backoff_factor=0.5,
+                              status_forcelist=[502, 503, 504])
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        # Async session used for downloads (only open during a scrape run)
+        self.http_session: Optional[aiohttp.ClientSession] = None
+
+        # Per-host rate limiting state for concurrent downloads, reset each run
+        # because asyncio locks are bound to the event loop that first waits on them
+        self._host_locks: Dict[str, asyncio.Lock] = {}
+        self._host_last_request: Dict[str, float] = {}
+
+        # URLs already found not to lead to a PDF, so they aren't checked again
+        self._invalid_urls = set()
+
+        # Filenames already taken by a download in the current run
+        self._claimed_filenames = set()
+
+        # Selenium driver, started on first use and reused across pages
+        self._driver: Optional[webdriver.Safari] = None
+
         # Store discovered papers
         self.papers = []
-        self.download_results = []
+
+        # Download results are appended to these files as each download finishes
+        self._results_ndjson: Optional[IO[bytes]] = None
+        self._results_csv_file: Optional[IO[str]] = None
+        self._results_csv = None
+        self._start_results()
 
         # Check robots.txt compliance
         self._check_robots_compliance()
 
-    def _check_robots_compliance(self):
-        """Check if we can fetch from the conference URL according to robots.txt"""
-        try:
-            parsed_url = urlparse(self.conference_url)
-            robots_url = f"{parsed_url.scheme}://{parsed_url.netloc}/robots.txt"
+    def _get_robot_parser(self, url: str) -> Optional[RobotFileParser]:
+        """
+        Get the robots.txt parser for the URL's host, fetching it if not cached or expired
 
+        Returns:
+            RobotFileParser, or None if robots.txt could not be read
+        """
+        parsed_url = urlparse(url)
+        netloc = parsed_url.netloc
+
+        # One lock per host, so a slow robots.txt doesn't hold up other hosts
+        with self._robots_lock:
+            host_lock = self._robots_host_locks.setdefault(netloc, threading.Lock())
+
+        with host_lock:
+            cached = self._robots_cache.get(netloc)
+            if cached:
+                rp, fetched_at = cached
+                ttl = self._ROBOTS_TTL if rp is not None else self._ROBOTS_FAILURE_TTL
+                if time.time() - fetched_at < ttl:
+                    return rp
+
+            robots_url = f"{parsed_url.scheme}://{netloc}/robots.txt"
             rp = RobotFileParser()
             rp.set_url(robots_url)
-            rp.read()
+            try:
+                # RobotFileParser.read() has no timeout, so fetch it ourselves
+                response = self.session.get(robots_url, timeout=10)
+                # Same status handling as RobotFileParser.read()
+                if response.status_code in (401, 403):
+                    rp.disallow_all = True
+                elif 400 <= response.status_code < 500:
+                    rp.allow_all = True
+                elif response.status_code >= 500:
+                    rp.disallow_all = True
+                else:
+                    rp.parse(response.content.decode('utf-8', errors='replace').splitlines())
+            except requests.exceptions.RetryError:
+                # The session's retries gave up on a 5xx status
+                rp.disallow_all = True
+            except Exception as e:
+                self.logger.debug(f"Could not read robots.txt for {netloc}: {e}")
+                rp = None
+
+            self._robots_cache[netloc] = (rp, time.time())
+            return rp
+
+    async def _robots_allows(self, url: str) -> bool:
+        """Check robots.txt for a URL without blocking the event loop"""
+        rp = await asyncio.to_thread(self._get_robot_parser, url)
+        return rp is None or rp.can_fetch(self.ROBOTS_USER_AGENT, url)
+
+    def _check_robots_compliance(self):
+        """Check if we can fetch from the conference URL according to robots.txt"""
+        try:
+            rp = self._get_robot_parser(self.conference_url)
+            if rp is None:
+                return
 
-            user_agent = 'Conference-Scraper/1.0'
+            user_agent = self.ROBOTS_USER_AGENT
             if not rp.can_fetch(user_agent, self.conference_url):
                 self.logger.warning(f"robots.txt prohibits fetching {self.conference_url}")
                 self.logger.info("Proceeding with caution and respecting rate limits")
@@ -102,95 +347,185 @@ class ConferenceScraper:
         )
         self.logger = logging.getLogger(__name__)
 
-    def _extract_papers_from_soup(self, soup: BeautifulSoup) -> List[Dict]:
-        """Extract paper information from BeautifulSoup object"""
-        paper_links = []
-
-        # Method 1: Look for paper links with typical patterns
-        for link in soup.find_all('a', href=True):
-            href = link['href']
-            text = link.get_text(strip=True)
-
-            # Check for common paper URL patterns
-            if any(pattern in href for pattern in ['/papers/', '/conf_papers/', '.pdf']):
-                paper_links.append({
-                    'url': urljoin(self.conference_url, href),
-                    'title': text,
-                    'type': 'direct_link'
-                })
-
-        # Method 2: Extract JavaScript data - look for conference papers variable
-        script_tags = soup.find_all('script')
-        for script in script_tags:
-            if script.string and 'Papers' in script.string:
-                # Try to extract paper IDs from JavaScript
-                # Pattern 1: Look for JSON.parse patterns
-                pattern = r'Papers\s*=\s*JSON\.parse\(\'(.*?)\'\)'
-                match = re.search(pattern, script.string)
-                if match:
-                    try:
-                        # Decode the JSON string
-                        json_str = match.group(1).encode().decode('unicode-escape')
-                        papers_data = json.loads(json_str)
-                        for paper in papers_data:
-                            if 'id' in paper:
-                                paper_id = paper['id']
-                                # Construct URL based on common patterns
-                                parsed = urlparse(self.conference_url)
-                                base_url = f"{parsed.scheme}://{parsed.netloc}"
-                                paper_links.append({
-                                    'url': f"{base_url}/conf_papers/{paper_id}.pdf",
-                                    'title': f"Paper {paper_id}",
-                                    'type': 'javascript_json'
-                                })
-                    except Exception as e:
-                        self.logger.debug(f"Failed to parse Papers JSON: {e}")
-
-                # Fallback: direct regex for paper IDs
-                matches = re.findall(r'"id":"([a-zA-Z0-9]+)"', script.string)
-                for paper_id in matches[:50]:  # Limit to prevent false positives
-                    parsed = urlparse(self.conference_url)
-                    base_url = f"{parsed.scheme}://{parsed.netloc}"
-                    paper_links.append({
-                        'url': f"{base_url}/conf_papers/{paper_id}.pdf",
-                        'title': f"Paper {paper_id}",
-                        'type': 'javascript_id'
-                    })
-
-        # Method 3: Look for paper titles and authors in the rendered content
-        sessions = soup.find_all(['div', 'section'], class_=re.compile('session|paper|presentation'))
-        for session in sessions:
-            potential_titles = session.find_all(['h3', 'h4', 'strong'])
-            for title in potential_titles:
-                title_text = title.get_text(strip=True)
-                if len(title_text) > 10:  # Likely a paper title
-                    parent = title.parent
-                    if parent:
-                        link = parent.find('a', href=True)
-                        if link:
-                            paper_links.append({
-                                'url': urljoin(self.conference_url, link['href']),
-                                'title': title_text,
-                                'type': 'session_extraction'
-                            })
-
-        # Deduplicate papers
-        papers = []
-        seen_urls = set()
-        for paper in paper_links:
-            if paper['url'] not in seen_urls:
-                seen_urls.add(paper['url'])
-                papers.append(paper)
+    def _open_http_session(self) -> aiohttp.ClientSession:
+        """Create the aiohttp session used for validating and downloading PDFs"""
+        return aiohttp.ClientSession(
+            headers={'User-Agent': self.session.headers['User-Agent']},
+            # No overall cap: large PDFs can take a while, and waiting for a pooled
+            # connection must not count against the download
+            timeout=aiohttp.ClientTimeout(total=None, connect=30, sock_read=30),
+            connector=aiohttp.TCPConnector(limit=32, limit_per_host=4)
+        )
 
-        return papers
+    async def _wait_for_host(self, url: str):
+        """Sleep until at least `delay` seconds have passed since the last request to this host"""
+        host = urlparse(url).netloc
+        lock = self._host_locks.setdefault(host, asyncio.Lock())
+
+        async with lock:
+            loop = asyncio.get_running_loop()
+            last_request = self._host_last_request.get(host)
+            if last_request is not None:
+                wait = self.delay - (loop.time() - last_request)
+                if wait > 0:
+                    await asyncio.sleep(wait)
+            self._host_last_request[host] = loop.time()
+
+    def _extract_papers_from_html(self, chunks: Iterable[AnyStr],
+                                  encoding: Optional[str] = None) -> List[Dict]:
+        """
+        Extract paper information from HTML, parsed incrementally as chunks arrive
+
+        Args:
+            chunks: HTML content as bytes or str chunks
+            encoding: Document encoding, if known from the response headers
+
+        Returns:
+            List of dictionaries containing paper information
+        """
+        papers: Dict[str, Dict] = {}
+
+        def add_paper(url: str, title: str, link_type: str):
+            # Methods are applied in one document-order pass, so a later hit from
+            # a higher-priority method replaces an earlier one for the same URL
+            existing = papers.get(url)
+            if existing is not None:
+                if _LINK_TYPE_PRIORITY[link_type] >= _LINK_TYPE_PRIORITY[existing['type']]:
+                    return
+                del papers[url]
+            papers[url] = {'url': url, 'title': title, 'type': link_type}
+
+        parsed = urlparse(self.conference_url)
+        base_url = f"{parsed.scheme}://{parsed.netloc}"
+
+        # Number of open elements whose subtree is still needed: links (for
+        # their text) and session blocks (for Method 3). Anything that ends
+        # outside of them is discarded right away.
+        open_keepers = 0
+
+        # Session blocks in start order (like find_all), handled once the
+        # outermost one has ended so nested blocks keep pre-order
+        session_blocks = []
+        open_sessions = 0
+
+        for event, element in _iter_html_events(chunks, encoding):
+            tag = element.tag
+            is_session = _is_session_block(element)
+            keep = tag == 'a' or is_session
+
+            if event == 'start':
+                if keep:
+                    open_keepers += 1
+                if is_session:
+                    session_blocks.append(element)
+                    open_sessions += 1
+                continue
+
+            # Method 1: Look for paper links with typical patterns
+            if tag == 'a':
+                href = element.get('href')
+
+                # Check for common paper URL patterns
+                if href is not None and any(pattern in href for pattern in ['/papers/', '/conf_papers/', '.pdf']):
+                    add_paper(urljoin(self.conference_url, href), _element_text(element), 'direct_link')
+
+            # Method 2: Extract JavaScript data - look for conference papers variable
+            elif tag == 'script':
+                script = element.text
+                if script and 'Papers' in script:
+                    # Try to extract paper IDs from JavaScript
+                    # Pattern 1: Look for JSON.parse patterns
+                    papers_data = None
+                    match = _PAPERS_JSON_RE.search(script)
+                    if match:
+                        try:
+                            # Decode the JSON string
+                            json_str = match.group(1).encode().decode('unicode-escape')
+                            papers_data = json.loads(json_str)
+                            for paper in papers_data:
+                                if 'id' in paper:
+                                    paper_id = paper['id']
+                                    # Construct URL based on common patterns
+                                    add_paper(f"{base_url}/conf_papers/{paper_id}.pdf",
+                                              f"Paper {paper_id}", 'javascript_json')
+                        except Exception as e:
+                            papers_data = None
+                            self.logger.debug(f"Failed to parse Papers JSON: {e}")
+
+                    # Fallback: direct regex for paper IDs, only needed if the JSON
+                    # could not be read. finditer stops scanning at the limit.
+                    if papers_data is None:
+                        matches = islice(_ID_RE.finditer(script), 50)  # Limit to prevent false positives
+                        for match in matches:
+                            paper_id = match.group(1)
+                            add_paper(f"{base_url}/conf_papers/{paper_id}.pdf",
+                                      f"Paper {paper_id}", 'javascript_id')
+
+            # Method 3: Look for paper titles and authors in the rendered content
+            if is_session:
+                open_sessions -= 1
+            if is_session and not open_sessions:
+                for block in session_blocks:
+                    for title in block.iter('h3', 'h4', 'strong'):
+                        title_text = _element_text(title)
+                        if len(title_text) > 10:  # Likely a paper title
+                            parent = title.getparent()
+                            if parent is not None:
+                                link = parent.find('.//a[@href]')
+                                if link is not None:
+                                    add_paper(urljoin(self.conference_url, link.get('href')),
+                                              title_text, 'session_extraction')
+                session_blocks.clear()
+
+            if keep:
+                open_keepers -= 1
+            if not open_keepers:
+                # Free the parsed subtree and any already-processed siblings
+                element.clear(keep_tail=True)
+                parent = element.getparent()
+                if parent is not None:
+                    while element.getprevious() is not None:
+                        del parent[0]
+
+        # Same order as running Method 1, 2 and 3 one after another
+        return sorted(papers.values(), key=lambda paper: _LINK_TYPE_PRIORITY[paper['type']])
 
     def _setup_selenium_driver(self) -> webdriver.Safari:
-        """Setup Selenium Safari driver"""
+        """Setup Selenium Safari driver, reusing the running one if available"""
+        if self._driver is not None:
+            try:
+                # Start each page with a clean session
+                self._driver.delete_all_cookies()
+                return self._driver
+            except Exception as e:
+                # The browser crashed or was closed; start a fresh one
+                self.logger.warning(f"Cached Safari driver is no longer usable, restarting: {e}")
+                try:
+                    self.close()
+                except Exception:
+                    pass
+
         # Safari WebDriver doesn't support headless mode or many Chrome options
         # Make sure Safari's Developer menu is enabled and
         # 'Allow Remote Automation' is checked
-        driver = webdriver.Safari()
-        return driver
+        self._driver = webdriver.Safari()
+        atexit.register(self.close)
+        return self._driver
+
+    def close(self):
+        """Quit the Selenium driver if one was started"""
+        if self._driver is not None:
+            atexit.unregister(self.close)
+            try:
+                self._driver.quit()
+            finally:
+                self._driver = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def extract_papers_from_page(self) -> List[Dict]:
         """
@@ -204,12 +539,17 @@ class ConferenceScraper:
 
         # Try using requests first
         try:
-            response = self.session.get(self.conference_url)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
+            with self.session.get(self.conference_url, stream=True) as response:
+                response.raise_for_status()
+
+                # Only trust the encoding if the server declared one
+                content_type = response.headers.get('content-type', '').lower()
+                encoding = response.encoding if 'charset=' in content_type else None
 
-            # Extract papers directly from HTML
-            papers = self._extract_papers_from_soup(soup)
+                # Extract papers directly from HTML while it streams in
+                papers = self._extract_papers_from_html(
+                    response.iter_content(chunk_size=65536), encoding
+                )
 
             if papers:
                 self.logger.info(f"Found {len(papers)} papers using requests")
@@ -240,86 +580,192 @@ class ConferenceScraper:
 
             # Get page source after JavaScript execution
             page_source = driver.page_source
-            soup = BeautifulSoup(page_source, 'html.parser')
 
             # Use helper method to extract papers
-            papers = self._extract_papers_from_soup(soup)
+            papers = self._extract_papers_from_html([page_source])
 
             self.logger.info(f"Found {len(papers)} potential paper links")
 
         except Exception as e:
             self.logger.error(f"Error extracting papers: {str(e)}")
 
-        finally:
-            driver.quit()
-
         self.papers = papers
         return papers
 
-    def validate_pdf_url(self, url: str) -> Tuple[bool, Optional[str]]:
+    async def _head_many(self, urls: List[str]) -> Dict[str, Tuple[int, str, str]]:
         """
-        Check if URL points to a valid PDF or paper page
+        Send HEAD requests for all URLs concurrently
 
         Returns:
-            Tuple of (is_valid, actual_pdf_url)
+            Dictionary mapping each reachable URL to (status, content_type, final_url)
         """
-        try:
-            response = self.session.head(url, allow_redirects=True, timeout=10)
+        timeout = aiohttp.ClientTimeout(total=10)
 
-            # Check if it's a PDF
-            content_type = response.headers.get('content-type', '').lower()
-            if 'application/pdf' in content_type:
-                return True, response.url
+        async def head(url: str) -> Tuple[int, str, str]:
+            await self._wait_for_host(url)
+            async with self.http_session.head(url, allow_redirects=True,
+                                              timeout=timeout) as response:
+                content_type = response.headers.get('content-type', '').lower()
+                return response.status, content_type, str(response.url)
 
-            # If not PDF, might be a paper page - try to extract PDF link
-            if response.status_code == 200:
-                # GET request to parse the page
-                page_response = self.session.get(url, timeout=10)
-                soup = BeautifulSoup(page_response.content, 'html.parser')
+        results = await self._gather_bounded([head(url) for url in urls])
+
+        heads = {}
+        for url, result in zip(urls, results):
+            if isinstance(result, Exception):
+                self.logger.warning(f"Error validating URL {url}: {str(result)}")
+            else:
+                heads[url] = result
+        return heads
+
+    async def _find_pdf_link(self, url: str) -> Optional[str]:
+        """Fetch a paper page and return the first PDF download link on it"""
+        timeout = aiohttp.ClientTimeout(total=10)
+        await self._wait_for_host(url)
+        async with self.http_session.get(url, timeout=timeout) as page_response:
+            content = await page_response.read()
+        # Only anchors are needed, so skip building the rest of the tree
+        soup = BeautifulSoup(content, 'lxml', parse_only=SoupStrainer('a', href=True))
+
+        # Look for PDF download links
+        pdf_links = soup.find_all('a', href=True, text=_PDF_LINK_TEXT_RE)
+        for link in pdf_links:
+            pdf_url = urljoin(url, link['href'])
+            if '.pdf' in pdf_url.lower():
+                return pdf_url
+
+        return None
+
+    async def validate_urls(self, urls: List[str]) -> Dict[str, str]:
+        """
+        Check which URLs point to a valid PDF or paper page, in one concurrent pass
 
-                # Look for PDF download links
-                pdf_links = soup.find_all('a', href=True, text=re.compile('PDF|Download', re.I))
-                for link in pdf_links:
-                    pdf_url = urljoin(url, link['href'])
-                    if '.pdf' in pdf_url.lower():
-                        return True, pdf_url
+        Returns:
+            Dictionary mapping each valid URL to its actual PDF URL
+        """
+        pdf_urls = {}
+        to_check = []
+
+        allowed = await asyncio.gather(*(self._robots_allows(url) for url in urls))
+        for url, is_allowed in zip(urls, allowed):
+            if not is_allowed:
+                self.logger.warning(f"robots.txt disallows fetching {url}")
+            elif url in self._invalid_urls:
+                continue
+            elif urlparse(url).path.lower().endswith('.pdf'):
+                # Direct PDF links skip the HEAD; download_pdf checks the response instead
+                pdf_urls[url] = url
+            else:
+                to_check.append(url)
 
-            return False, None
+        heads = await self._head_many(to_check)
 
-        except Exception as e:
-            self.logger.warning(f"Error validating URL {url}: {str(e)}")
-            return False, None
+        paper_pages = []
+        for url, (status, content_type, final_url) in heads.items():
+            if 'application/pdf' in content_type:
+                pdf_urls[url] = final_url
+            elif status == 200:
+                # Not a PDF, but might be a paper page linking to one
+                paper_pages.append(url)
+            else:
+                self._invalid_urls.add(url)
+
+        # Second round: fetch paper pages to find embedded PDF links
+        results = await self._gather_bounded([self._find_pdf_link(url) for url in paper_pages])
+        for url, result in zip(paper_pages, results):
+            if isinstance(result, Exception):
+                self.logger.warning(f"Error validating URL {url}: {str(result)}")
+            elif result:
+                pdf_urls[url] = result
+            else:
+                self._invalid_urls.add(url)
+
+        return pdf_urls
+
+    async def validate_pdf_url(self, url: str) -> Tuple[bool, Optional[str]]:
+        """
+        Check if URL points to a valid PDF or paper page
 
-    def download_pdf(self, url: str, title: str = None) -> bool:
+        Returns:
+            Tuple of (is_valid, actual_pdf_url)
+        """
+        pdf_url = (await self.validate_urls([url])).get(url)
+        return pdf_url is not None, pdf_url
+
+    def _start_results(self):
+        """Close any open result files and start a new set for the next run"""
+        self._close_results()
+        self._results_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self._result_counts = Counter()
+
+    def _close_results(self):
+        """Close the result files if they are open"""
+        if self._results_ndjson is not None:
+            self._results_ndjson.close()
+            self._results_csv_file.close()
+            self._results_ndjson = self._results_csv_file = self._results_csv = None
+
+    def _record_result(self, record: Dict[str, Any]):
+        """Append a download result to the NDJSON and CSV result files"""
+        if self._results_ndjson is None:
+            timestamp = self._results_timestamp
+            self._results_ndjson = open(self.log_dir / f"scraping_results_{timestamp}.ndjson", 'wb')
+            self._results_csv_file = open(self.log_dir / f"download_summary_{timestamp}.csv",
+                                          'w', newline='')
+            self._results_csv = csv.writer(self._results_csv_file, lineterminator='\n')
+            self._results_csv.writerow(self.RESULT_COLUMNS)
+
+        self._results_ndjson.write(orjson.dumps(record) + b'\n')
+        self._results_csv.writerow([record.get(column) for column in self.RESULT_COLUMNS])
+
+        # Flush so the results survive a crash mid-run
+        self._results_ndjson.flush()
+        self._results_csv_file.flush()
+
+        self._result_counts[record['status']] += 1
+
+    async def download_pdf(self, url: str, title: str = None,
+                           pdf_url: Optional[str] = None) -> bool:
         """
         Download a PDF from the given URL
 
         Args:
             url: URL of the PDF
             title: Optional title for filename
+            pdf_url: Actual PDF URL if `url` was already validated
 
         Returns:
             True if successful, False otherwise
         """
+        part_path = None
         try:
-            # Validate and get actual PDF URL
-            is_valid, pdf_url = self.validate_pdf_url(url)
+            if pdf_url is None:
+                # Validate and get actual PDF URL
+                is_valid, pdf_url = await self.validate_pdf_url(url)
 
-            if not is_valid or not pdf_url:
-                self.logger.warning(f"Invalid or inaccessible PDF URL: {url}")
-                return False
+                if not is_valid or not pdf_url:
+                    self.logger.warning(f"Invalid or inaccessible PDF URL: {url}")
+                    return False
 
             # Generate filename
             if title:
-                # Clean title for filename
-                filename = re.sub(r'[^\w\s-]', '', title)
-                filename = re.sub(r'[-\s]+', '_', filename)[:100]  # Limit length
-                filename = f"{filename}.pdf"
+                filename = f"{_title_to_filename(title)}.pdf"
             else:
                 # Use URL basename
                 filename = os.path.basename(urlparse(pdf_url).path)
                 if not filename.endswith('.pdf'):
-                    filename = f"paper_{hash(pdf_url)}.pdf"
+                    # Stable across runs, so existing files are skipped
+                    filename = f"paper_{_url_digest(pdf_url)}.pdf"
+
+            # Papers sharing a cleaned title get the URL digest appended, so
+            # concurrent downloads never write to the same file
+            if filename in self._claimed_filenames:
+                filename = f"{filename[:-len('.pdf')]}_{_url_digest(pdf_url)}.pdf"
+                if filename in self._claimed_filenames:
+                    # Same PDF reached through another paper URL
+                    self.logger.info(f"Already downloading: {filename}")
+                    return True
+            self._claimed_filenames.add(filename)
 
             filepath = self.download_dir / filename
 
@@ -328,20 +774,37 @@ class ConferenceScraper:
                 self.logger.info(f"Already downloaded: {filename}")
                 return True
 
+            # The resolved PDF may live on another host or path
+            if pdf_url != url and not await self._robots_allows(pdf_url):
+                raise PermissionError(f"robots.txt disallows fetching {pdf_url}")
+
+            # Respect the delay between requests to the same host
+            await self._wait_for_host(pdf_url)
+
             # Download the PDF
             self.logger.info(f"Downloading: {filename}")
-            response = self.session.get(pdf_url, stream=True, timeout=30)
-            response.raise_for_status()
-
-            # Save to file
-            with open(filepath, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+            async with self.http_session.get(pdf_url) as response:
+                # Unverified .pdf links may turn out to be missing or an HTML error page
+                content_type = response.headers.get('content-type', '').lower()
+                if response.status in (404, 410) or 'text/html' in content_type:
+                    self._invalid_urls.add(url)
+                response.raise_for_status()
+                if 'text/html' in content_type:
+                    raise ValueError(f"Expected a PDF but got {content_type}")
+
+                # Stream to a partial file, so an interrupted download is never
+                # mistaken for a finished one
+                part_path = filepath.with_name(f"{filename}.part")
+                async with aiofiles.open(part_path, 'wb') as f:
+                    async for chunk in response.content.iter_chunked(65536):
+                        await f.write(chunk)
+
+            os.replace(part_path, filepath)
 
             self.logger.info(f"Successfully downloaded: {filename}")
 
             # Record download
-            self.download_results.append({
+            self._record_result({
                 'url': url,
                 'pdf_url': pdf_url,
                 'title': title,
@@ -355,7 +818,10 @@ class ConferenceScraper:
         except Exception as e:
             self.logger.error(f"Error downloading {url}: {str(e)}")
 
-            self.download_results.append({
+            if part_path is not None:
+                part_path.unlink(missing_ok=True)
+
+            self._record_result({
                 'url': url,
                 'title': title,
                 'status': 'failed',
@@ -373,6 +839,9 @@ class ConferenceScraper:
         self.logger.info(f"Download directory: {self.download_dir}")
         self.logger.info("="*50)
 
+        # Each run writes its own result files and counts
+        self._start_results()
+
         # Extract papers from the page
         papers = self.extract_papers_from_page()
 
@@ -383,13 +852,7 @@ class ConferenceScraper:
         # Download papers with progress bar
         self.logger.info(f"Attempting to download {len(papers)} papers...")
 
-        success_count = 0
-        for paper in tqdm(papers, desc="Downloading papers"):
-            if self.download_pdf(paper['url'], paper.get('title')):
-                success_count += 1
-
-            # Respectful delay between downloads
-            time.sleep(self.delay)
+        success_count = asyncio.run(self._download_papers(papers))
 
         # Generate summary report
         self.generate_report()
@@ -399,25 +862,86 @@ class ConferenceScraper:
         self.logger.info(f"Successfully downloaded: {success_count}/{len(papers)} papers")
         self.logger.info("="*50)
 
-    def generate_report(self):
-        """Generate a summary report of the scraping results"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    async def _gather_bounded(self, aws: List[Awaitable], desc: Optional[str] = None) -> list:
+        """
+        Await all awaitables concurrently, at most `max_concurrent` at a time
+
+        Args:
+            aws: Awaitables to run
+            desc: Show a progress bar with this description if given
+
+        Returns:
+            Results in input order, with exceptions returned in place of results
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrent)
+
+        async def bounded(aw: Awaitable):
+            async with semaphore:
+                try:
+                    return await aw
+                except Exception as e:
+                    return e
+
+        # Schedule in input order (tqdm's gather would start them in set order),
+        # so e.g. filename claims are the same on every run
+        tasks = [asyncio.ensure_future(bounded(aw)) for aw in aws]
+        if desc:
+            return await tqdm_asyncio.gather(*tasks, desc=desc)
+        return await asyncio.gather(*tasks)
+
+    async def _download_papers(self, papers: List[Dict]) -> int:
+        """
+        Validate all paper URLs in one batch, then download the valid ones concurrently
 
-        # Save detailed results as JSON
-        json_report = self.log_dir / f"scraping_results_{timestamp}.json"
-        with open(json_report, 'w') as f:
-            json.dump({
+        Returns:
+            Number of successfully downloaded papers
+        """
+        self._claimed_filenames.clear()
+        # Each run has its own event loop, so it needs its own host locks
+        self._host_locks.clear()
+        self._host_last_request.clear()
+
+        async with self._open_http_session() as self.http_session:
+            try:
+                pdf_urls = await self.validate_urls([paper['url'] for paper in papers])
+
+                valid_papers = [paper for paper in papers if paper['url'] in pdf_urls]
+                for paper in papers:
+                    if paper['url'] not in pdf_urls:
+                        self.logger.warning(f"Invalid or inaccessible PDF URL: {paper['url']}")
+                self.logger.info(f"{len(valid_papers)}/{len(papers)} paper URLs are valid")
+
+                results = await self._gather_bounded(
+                    [self.download_pdf(paper['url'], paper.get('title'),
+                                       pdf_url=pdf_urls[paper['url']])
+                     for paper in valid_papers],
+                    desc="Downloading papers"
+                )
+            finally:
+                self.http_session = None
+
+        return sum(result is True for result in results)
+
+    def generate_report(self):
+        """Close the result files and save a summary of the scraping results"""
+        timestamp = self._results_timestamp
+
+        # Per-download results were already written as they finished; the files
+        # only exist if at least one result was recorded this run
+        results_file = None
+        if self._results_ndjson is not None:
+            results_file = f"scraping_results_{timestamp}.ndjson"
+        self._close_results()
+
+        summary_report = self.log_dir / f"scraping_summary_{timestamp}.json"
+        with open(summary_report, 'wb') as f:
+            f.write(orjson.dumps({
                 'conference_url': self.conference_url,
                 'timestamp': timestamp,
                 'papers_found': len(self.papers),
-                'download_results': self.download_results
-            }, f, indent=2)
-
-        # Create CSV report
-        if self.download_results:
-            df = pd.DataFrame(self.download_results)
-            csv_report = self.log_dir / f"download_summary_{timestamp}.csv"
-            df.to_csv(csv_report, index=False)
+                'download_counts': dict(self._result_counts),
+                'download_results': results_file
+            }, option=orjson.OPT_INDENT_2))
 
         self.logger.info(f"Reports saved to {self.log_dir}")
 
@@ -432,7 +956,8 @@ def main():
         conference_url=conference_url,
         download_dir="downloads",
         log_dir="logs",
-        delay=2.0  # 2 second delay between downloads
+        delay=2.0,  # 2 second delay between requests to the same host
+        max_concurrent=10
     )
 
     scraper.scrape_conference()
@@ -4,15 +4,21 @@ NBER Paper Extractor - Alternative extraction methods for NBER papers
 Handles specific paper IDs and searches for papers by title
 """
 
+import os
 import re
 import json
+import atexit
 import time
+import asyncio
 import logging
 from pathlib import Path
-from typing import List, Dict
+from typing import ClassVar, List, Dict, Optional
 
+import aiohttp
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup, SoupStrainer
+from urllib3.util.retry import Retry
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -22,14 +28,37 @@ from selenium.webdriver.chrome.service import Service
 from webdriver_manager.chrome import ChromeDriverManager
 
 
+# Patterns used while parsing NBER pages (the ID patterns match raw page bytes)
+_PAPER_ID_F_RE = re.compile(rb'"id":"(f\d+)"')
+_WP_RE = re.compile(rb'/papers/w(\d+)')
+_SEARCH_RESULT_CLS_RE = re.compile(r'search-result|paper')
+
+
 class NBERPaperExtractor:
     """Extract specific NBER papers using various methods"""
 
+    # Resolved chromedriver path, shared by all instances
+    _chromedriver_path: ClassVar[Optional[str]] = None
+
     def __init__(self):
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'NBER-Paper-Extractor/1.0 (Research purposes)'
         })
+
+        # Reuse pooled keep-alive connections and retry transient server errors
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=64,
+            max_retries=Retry(total=3, backoff_factor=0.5,
+                              status_forcelist=[502, 503, 504])
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        # Chrome driver, started on first use and reused across pages
+        self._driver: Optional[webdriver.Chrome] = None
+
         self.setup_logging()
 
     def setup_logging(self):
@@ -39,6 +68,58 @@ class NBERPaperExtractor:
         )
         self.logger = logging.getLogger(__name__)
 
+    def _setup_selenium_driver(self) -> webdriver.Chrome:
+        """Setup headless Chrome driver, reusing the running one if available"""
+        if self._driver is not None:
+            try:
+                # Start each page with a clean session
+                self._driver.delete_all_cookies()
+                return self._driver
+            except Exception as e:
+                # The browser crashed or was closed; start a fresh one
+                self.logger.warning(f"Cached Chrome driver is no longer usable, restarting: {e}")
+                try:
+                    self.close()
+                except Exception:
+                    pass
+
+        options = Options()
+        options.add_argument('--headless')
+        options.add_argument('--no-sandbox')
+        options.add_argument('--disable-dev-shm-usage')
+
+        service = Service(self._get_chromedriver_path())
+        self._driver = webdriver.Chrome(service=service, options=options)
+        atexit.register(self.close)
+        return self._driver
+
+    @classmethod
+    def _get_chromedriver_path(cls) -> str:
+        """
+        Get the chromedriver path, resolving it at most once per process
+
+        Set CHROMEDRIVER_PATH to use a preinstalled driver and skip the
+        webdriver-manager version check entirely.
+        """
+        if cls._chromedriver_path is None:
+            cls._chromedriver_path = os.environ.get('CHROMEDRIVER_PATH') or ChromeDriverManager().install()
+        return cls._chromedriver_path
+
+    def close(self):
+        """Quit the Chrome driver if one was started"""
+        if self._driver is not None:
+            atexit.unregister(self.close)
+            try:
+                self._driver.quit()
+            finally:
+                self._driver = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def extract_paper_ids_from_page(self, url: str) -> List[str]:
         """
         Extract paper IDs from the conference page JavaScript
@@ -52,16 +133,14 @@ class NBERPaperExtractor:
             response = self.session.get(url)
             response.raise_for_status()
 
-            # Look for confPapers array in the page
-            pattern = r'"id":"(f\d+)"'
-            matches = re.findall(pattern, response.text)
+            # Search the raw bytes; the IDs are ASCII, so the body never needs decoding
+            body = response.content
 
-            # Also look for working paper numbers
-            wp_pattern = r'/papers/w(\d+)'
-            wp_matches = re.findall(wp_pattern, response.text)
+            # Look for confPapers array in the page, keeping page order
+            paper_ids = [m.decode() for m in dict.fromkeys(_PAPER_ID_F_RE.findall(body))]
 
-            paper_ids = list(set(matches))
-            working_paper_ids = list(set(wp_matches))
+            # Also look for working paper numbers
+            working_paper_ids = [m.decode() for m in dict.fromkeys(_WP_RE.findall(body))]
 
             self.logger.info(f"Found {len(paper_ids)} conference paper IDs")
             self.logger.info(f"Found {len(working_paper_ids)} working paper IDs")
@@ -92,10 +171,12 @@ class NBERPaperExtractor:
 
         try:
             response = self.session.get(search_url, params=params)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            # Only search result containers are needed, so skip building the rest of the tree
+            soup = BeautifulSoup(response.content, 'lxml',
+                                 parse_only=SoupStrainer('div', class_=_SEARCH_RESULT_CLS_RE))
 
             # Look for search results
-            search_results = soup.find_all('div', class_=re.compile('search-result|paper'))
+            search_results = soup.find_all('div', class_=_SEARCH_RESULT_CLS_RE)
 
             for result in search_results:
                 link = result.find('a', href=True)
@@ -154,6 +235,61 @@ class NBERPaperExtractor:
         except:
             return False
 
+    def _open_http_session(self) -> aiohttp.ClientSession:
+        """Create an aiohttp session for probing candidate URLs"""
+        return aiohttp.ClientSession(
+            headers={'User-Agent': self.session.headers['User-Agent']},
+            connector=aiohttp.TCPConnector(limit=32, limit_per_host=8)
+        )
+
+    async def find_first_valid_url(self, http_session: aiohttp.ClientSession,
+                                   urls: List[str]) -> Optional[str]:
+        """
+        Probe all candidate URLs at once and return the first to respond with 200
+
+        Args:
+            http_session: Session to send the HEAD requests with
+            urls: Candidate URLs, e.g. from generate_paper_urls
+
+        Returns:
+            The first valid URL to respond, or None if none are valid
+        """
+        timeout = aiohttp.ClientTimeout(total=5)
+
+        async def probe(url: str) -> Optional[str]:
+            async with http_session.head(url, allow_redirects=True, timeout=timeout) as response:
+                return url if response.status == 200 else None
+
+        tasks = [asyncio.create_task(probe(url)) for url in urls]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                try:
+                    valid_url = await next_done
+                except Exception:
+                    continue
+                if valid_url:
+                    return valid_url
+            return None
+        finally:
+            # Stop the probes that are still in flight
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def find_valid_urls(self, paper_ids: List[str]) -> Dict[str, Optional[str]]:
+        """
+        Find a valid URL for each paper ID, probing all papers' candidates concurrently
+
+        Returns:
+            Dictionary mapping each paper ID to its first valid URL, or None
+        """
+        async with self._open_http_session() as http_session:
+            valid_urls = await asyncio.gather(*(
+                self.find_first_valid_url(http_session, self.generate_paper_urls(paper_id))
+                for paper_id in paper_ids
+            ))
+        return dict(zip(paper_ids, valid_urls))
+
     def extract_paper_with_selenium(self, conference_url: str) -> List[Dict]:
         """
         Use Selenium to fully render the page and extract paper links
@@ -163,17 +299,10 @@ class NBERPaperExtractor:
         """
         self.logger.info("Using Selenium to extract dynamically loaded papers...")
 
-        options = Options()
-        options.add_argument('--headless')
-        options.add_argument('--no-sandbox')
-        options.add_argument('--disable-dev-shm-usage')
-
-        service = Service(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=options)
-
         papers = []
 
         try:
+            driver = self._setup_selenium_driver()
             driver.get(conference_url)
 
             # Wait for dynamic content to load
@@ -184,72 +313,81 @@ class NBERPaperExtractor:
             # Additional wait for JavaScript rendering
             time.sleep(10)
 
-            # Try to find papers by various methods
-            # Method 1: Look for links with paper titles
-            links = driver.find_elements(By.TAG_NAME, 'a')
-
-            for link in links:
-                href = link.get_attribute('href')
-                text = link.text.strip()
-
-                if href and text and len(text) > 10:
-                    # Check if it looks like a paper link
-                    if any(pattern in href.lower() for pattern in ['paper', 'pdf', 'download', '/w']):
-                        papers.append({
-                            'title': text,
-                            'url': href
-                        })
-
-            # Method 2: Execute JavaScript to get paper data
-            try:
-                paper_data = driver.execute_script("""
+            # Collect link data and confPapers in one WebDriver round-trip
+            # instead of querying each element separately. confPapers is copied
+            # through JSON so a value WebDriver can't serialize (cyclic, DOM
+            # nodes) falls back to [] instead of failing the whole call
+            page_data = driver.execute_script("""
+                let papers = [];
+                try {
                     if (typeof confPapers !== 'undefined') {
-                        return confPapers;
+                        papers = JSON.parse(JSON.stringify(confPapers));
                     }
-                    return [];
-                """)
+                } catch (e) {
+                    papers = [];
+                }
+                return {
+                    links: Array.from(document.querySelectorAll('a'))
+                        .map(a => [a.href, a.innerText.trim()])
+                        .filter(([href, text]) => href && text.length > 10),
+                    confPapers: Array.isArray(papers) ? papers : []
+                };
+            """)
 
-                if paper_data:
-                    self.logger.info(f"Found {len(paper_data)} papers in JavaScript data")
-                    for paper in paper_data:
-                        if 'id' in paper:
-                            papers.append({
-                                'id': paper['id'],
-                                'urls': self.generate_paper_urls(paper['id'])
-                            })
+            # Method 1: Look for links with paper titles
+            for href, text in page_data['links']:
+                # Check if it looks like a paper link
+                if any(pattern in href.lower() for pattern in ['paper', 'pdf', 'download', '/w']):
+                    papers.append({
+                        'title': text,
+                        'url': href
+                    })
 
-            except:
-                pass
+            # Method 2: Paper data from JavaScript
+            paper_data = page_data['confPapers']
+            if paper_data:
+                self.logger.info(f"Found {len(paper_data)} papers in JavaScript data")
+                for paper in paper_data:
+                    if isinstance(paper, dict) and 'id' in paper:
+                        papers.append({
+                            'id': paper['id'],
+                            'urls': self.generate_paper_urls(paper['id'])
+                        })
 
             self.logger.info(f"Extracted {len(papers)} papers with Selenium")
 
         except Exception as e:
             self.logger.error(f"Selenium extraction error: {str(e)}")
 
-        finally:
-            driver.quit()
-
         return papers
 
 
-def main():
-    """Main function to demonstrate extraction methods"""
-    conference_url = "https://www.nber.org/conferences/economics-transformative-ai-workshop-fall-2025"
-
-    extractor = NBERPaperExtractor()
+async def run_demo(extractor: NBERPaperExtractor, conference_url: str,
+                   specific_papers: List[str]):
+    """Run the extraction demo, overlapping the steps that don't depend on each other"""
+    # Start everything that only needs the conference URL or a title right away;
+    # the blocking requests/Selenium calls run in worker threads
+    ids_task = asyncio.create_task(
+        asyncio.to_thread(extractor.extract_paper_ids_from_page, conference_url)
+    )
+    search_tasks = [
+        asyncio.create_task(asyncio.to_thread(extractor.search_for_paper_by_title, title))
+        for title in specific_papers
+    ]
+    selenium_task = asyncio.create_task(
+        asyncio.to_thread(extractor.extract_paper_with_selenium, conference_url)
+    )
 
-    # Extract paper IDs from the page
-    conf_ids, wp_ids = extractor.extract_paper_ids_from_page(conference_url)
+    # URL probing needs the extracted IDs, then fans out across all papers
+    conf_ids, wp_ids = await ids_task
+    valid_urls = await extractor.find_valid_urls(conf_ids[:10])  # Show first 10
 
     print("\n" + "="*50)
     print("Conference Paper IDs found:")
-    for pid in conf_ids[:10]:  # Show first 10
+    for pid, valid_url in valid_urls.items():
         print(f"  - {pid}")
-        urls = extractor.generate_paper_urls(pid)
-        for url in urls:
-            if extractor.check_url_validity(url):
-                print(f"    ✓ Valid URL: {url}")
-                break
+        if valid_url:
+            print(f"    ✓ Valid URL: {valid_url}")
 
     print("\n" + "="*50)
     print("Working Paper IDs found:")
@@ -260,14 +398,7 @@ def main():
     print("\n" + "="*50)
     print("Searching for specific papers...")
 
-    specific_papers = [
-        "AI Exposure and the Adaptive Capacity of American Workers",
-        "Economics of Transformative AI",
-        "Artificial Intelligence and Economic Growth"
-    ]
-
-    for title in specific_papers:
-        results = extractor.search_for_paper_by_title(title)
+    for title, results in zip(specific_papers, await asyncio.gather(*search_tasks)):
         if results:
             print(f"\nFound for '{title}':")
             for result in results[:3]:  # Show first 3 results
@@ -277,9 +408,24 @@ def main():
     # Try Selenium extraction
     print("\n" + "="*50)
     print("Extracting with Selenium...")
-    selenium_papers = extractor.extract_paper_with_selenium(conference_url)
+    selenium_papers = await selenium_task
     print(f"Found {len(selenium_papers)} papers with Selenium")
 
 
+def main():
+    """Main function to demonstrate extraction methods"""
+    conference_url = "https://www.nber.org/conferences/economics-transformative-ai-workshop-fall-2025"
+
+    extractor = NBERPaperExtractor()
+
+    specific_papers = [
+        "AI Exposure and the Adaptive Capacity of American Workers",
+        "Economics of Transformative AI",
+        "Artificial Intelligence and Economic Growth"
+    ]
+
+    asyncio.run(run_demo(extractor, conference_url, specific_papers))
+
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()